@@ -0,0 +1,31 @@
+"""
+Lazily created rich console shared by the installer and launcher
+
+rich takes a noticeable share of CLI start-up, so it is only imported once
+something is actually printed.
+"""
+
+from typing import Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class LazyConsole:
+    """Console attribute that creates a rich Console on first use and stays assignable"""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        console = instance.__dict__.get(self._attr)
+        if console is None:
+            from rich.console import Console
+            console = instance.__dict__[self._attr] = Console()
+        return console
+
+    def __set__(self, instance: Any, console: Optional["Console"]) -> None:
+        # None defers creation to the next read
+        instance.__dict__[self._attr] = console
@@ -0,0 +1,162 @@
+"""
+Platform checks, PATH lookups and process-group handling shared by the whole package
+
+sys.platform is a constant; platform.system() may shell out to uname, so it is
+avoided at import time.
+"""
+
+import os
+import platform
+import signal
+import subprocess
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+
+IS_WINDOWS = sys.platform.startswith("win")
+IS_DARWIN = sys.platform == "darwin"
+IS_LINUX = sys.platform.startswith("linux")
+
+# Lower-cased platform.system() name, as reported in server info; only
+# uncommon platforms actually need to ask platform.system()
+PLATFORM = (
+    "windows" if IS_WINDOWS
+    else "darwin" if IS_DARWIN
+    else "linux" if IS_LINUX
+    else platform.system().lower()
+)
+
+# Start child processes in their own process group, so stopping one also stops
+# whatever it spawned (uvx runs Python, which runs Node; npm runs lifecycle scripts)
+NEW_GROUP_KWARGS: Dict[str, Any] = (
+    {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if IS_WINDOWS else {"start_new_session": True}
+)
+
+
+# Last PATH scan as (PATH, directory mtimes, {executable name: candidate paths in PATH order})
+_path_scan: Optional[Tuple[str, Tuple[int, ...], Dict[str, List[str]]]] = None
+
+
+def _path_dirs_signature(path_env: str) -> Tuple[int, ...]:
+    """Modification times of the PATH directories; they change when an entry is added or removed"""
+    signature = []
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            signature.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            signature.append(-1)
+    return tuple(signature)
+
+
+def _scan_path_executables() -> Dict[str, List[str]]:
+    """
+    Index the entries of every PATH directory by name, listing each directory once.
+    
+    On Windows, like shutil.which, only files with a PATHEXT extension count:
+    they are indexed lower-cased, with and without the extension, and within a
+    directory in PATHEXT order, so "npm" finds "npm.cmd" and never the
+    extensionless sh script next to it. The index is rebuilt when PATH changes.
+    """
+    global _path_scan
+    
+    path_env = os.environ.get("PATH", os.defpath)
+    if _path_scan is not None and _path_scan[0] == path_env:
+        return _path_scan[2]
+        
+    # Taken before scanning, so a change made mid-scan is caught by the next check
+    signature = _path_dirs_signature(path_env)
+        
+    pathext: Dict[str, int] = {}
+    if IS_WINDOWS:
+        for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep):
+            if ext:
+                pathext.setdefault(ext.lower(), len(pathext))
+                
+    index: Dict[str, List[str]] = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                if not IS_WINDOWS:
+                    for entry in entries:
+                        index.setdefault(entry.name, []).append(entry.path)
+                    continue
+                    
+                # Bare names resolve to this directory's entries in PATHEXT order
+                by_stem: Dict[str, List[Tuple[int, str]]] = {}
+                for entry in entries:
+                    name = entry.name.lower()
+                    stem, ext = os.path.splitext(name)
+                    if ext in pathext:
+                        index.setdefault(name, []).append(entry.path)
+                        by_stem.setdefault(stem, []).append((pathext[ext], entry.path))
+                for stem, ranked in by_stem.items():
+                    index.setdefault(stem, []).extend(path for _, path in sorted(ranked))
+        except OSError:
+            continue  # Missing or unreadable PATH entry
+            
+    _path_scan = (path_env, signature, index)
+    _resolve_executable.cache_clear()
+    return index
+
+
+@lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> Optional[str]:
+    """First runnable PATH candidate for name; cleared whenever the PATH index is rebuilt"""
+    candidates = _scan_path_executables().get(name.lower() if IS_WINDOWS else name, ())
+    for candidate in candidates:
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return None
+
+
+def path_scan_outdated() -> bool:
+    """Whether a PATH directory gained or lost entries since the current index was built"""
+    path_env = os.environ.get("PATH", os.defpath)
+    return _path_scan is not None and _path_scan[0] == path_env and _path_scan[1] != _path_dirs_signature(path_env)
+
+
+def which(name: str) -> Optional[str]:
+    """shutil.which equivalent backed by the cached PATH index"""
+    _scan_path_executables()  # Rebuilds the index and drops resolved names if PATH changed
+    return _resolve_executable(name)
+
+
+def invalidate_path_cache() -> None:
+    """Forget the PATH index and resolved names, e.g. after installing a tool into PATH"""
+    global _path_scan
+    _path_scan = None
+    _resolve_executable.cache_clear()
+
+
+def signal_group(process: subprocess.Popen, force: bool = False) -> None:
+    """Ask a grouped process and its process group to exit, or kill them when force is set"""
+    try:
+        if IS_WINDOWS:
+            if process.poll() is not None:
+                return
+            # CTRL_BREAK_EVENT reaches the whole group; there is no group-wide kill
+            if force:
+                process.kill()
+            else:
+                process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            # Grouped processes lead their own session (pgid == pid). The group is
+            # signalled even when the leader has exited, as its children may not have.
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+    except OSError:
+        pass  # Already gone
+
+
+def stop_process(process: subprocess.Popen, timeout: float) -> None:
+    """Stop a grouped process gracefully, killing it if it outlives the timeout"""
+    signal_group(process)
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        signal_group(process, force=True)
+        process.wait(timeout=5)
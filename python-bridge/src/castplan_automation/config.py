@@ -8,9 +8,10 @@ intelligent environment detection for optimal MCP client compatibility.
 
 import os
 import json
-import platform
 import shutil
+import stat
 import subprocess
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union, Tuple
 from dataclasses import dataclass, asdict, field
@@ -24,6 +25,57 @@ from rich.text import Text
 from rich.tree import Tree
 from pydantic import BaseModel, Field
 
+from ._platform import IS_WINDOWS, IS_DARWIN, IS_LINUX, PLATFORM
+
+
+# Display names for enum values ("uvx_ephemeral" -> "Uvx Ephemeral"), filled lazily
+_TITLE_CACHE: Dict[str, str] = {}
+
+
+def _pretty(value: str) -> str:
+    """Return a human-readable title for an enum value, caching the result"""
+    title = _TITLE_CACHE.get(value)
+    if title is None:
+        title = _TITLE_CACHE[value] = value.replace("_", " ").title()
+    return title
+
+
+def _merge_servers(existing: Dict[str, Any], new: Dict[str, Any], key: str) -> None:
+    """Merge servers already configured under ``key`` into ``new`` in place"""
+    previous = existing.get(key)
+    if previous:
+        previous.update(new[key])
+        new[key] = previous
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Write JSON via a synced temp file + rename so a crash never truncates the config"""
+    # Replace the real file, so a symlinked config (e.g. from a dotfile manager) stays a symlink
+    path = Path(os.path.realpath(path))
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    # A unique temp file (created 0600), so concurrent writers never rename each other's partial output
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        try:
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))  # Keep an existing config's permissions
+            except FileNotFoundError:
+                pass  # New config: stays private
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            # fdatasync is not available everywhere (e.g. macOS, Windows)
+            getattr(os, "fdatasync", os.fsync)(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class ConfigError(Exception):
     """Base exception for configuration errors"""
@@ -98,9 +150,10 @@ class ConfigurationManager:
         self.nodejs_package = nodejs_package
         self.python_package = python_package
         self.console = console or Console()
-        self.platform = platform.system().lower()
+        self.platform = PLATFORM
         self.detected_environments: List[EnvironmentDetection] = []
         self.available_methods: List[LaunchMethod] = []
+        self._summary_table: Optional[Tuple[List[EnvironmentDetection], Table]] = None
         self._detect_available_methods()
         
     def _detect_available_methods(self) -> None:
@@ -108,15 +161,15 @@ class ConfigurationManager:
         methods = []
         
         # Check for uvx
-        if shutil.which("uvx") or (self.platform == "windows" and shutil.which("uvx.exe")):
+        if shutil.which("uvx") or (IS_WINDOWS and shutil.which("uvx.exe")):
             methods.append(LaunchMethod.UVX_EPHEMERAL)
             
         # Check for uv
-        if shutil.which("uv") or (self.platform == "windows" and shutil.which("uv.exe")):
+        if shutil.which("uv") or (IS_WINDOWS and shutil.which("uv.exe")):
             methods.append(LaunchMethod.UV_PROJECT)
             
         # Check for Node.js
-        if shutil.which("node") or (self.platform == "windows" and shutil.which("node.exe")):
+        if shutil.which("node") or (IS_WINDOWS and shutil.which("node.exe")):
             methods.append(LaunchMethod.NODEJS_DIRECT)
             
         # Python bridge is always available
@@ -166,20 +219,20 @@ class ConfigurationManager:
         """Detect Claude Desktop environment"""
         locations = []
         
-        if self.platform == "windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             if appdata:
                 locations.append(
                     self._check_location("Claude Desktop (AppData)", 
                                        Path(appdata) / "Claude" / "claude_desktop_config.json")
                 )
-        elif self.platform == "darwin":
+        elif IS_DARWIN:
             home = Path.home()
             locations.append(
                 self._check_location("Claude Desktop (macOS)",
                                    home / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json")
             )
-        elif self.platform == "linux":
+        elif IS_LINUX:
             home = Path.home()
             locations.extend([
                 self._check_location("Claude Desktop (XDG)",
@@ -232,7 +285,7 @@ class ConfigurationManager:
         """Detect Cline (Claude-dev) VS Code extension"""
         locations = []
         
-        if self.platform == "windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             if appdata:
                 locations.append(
@@ -264,7 +317,7 @@ class ConfigurationManager:
         """Detect Cursor IDE"""
         locations = []
         
-        if self.platform == "windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             if appdata:
                 locations.append(
@@ -327,20 +380,20 @@ class ConfigurationManager:
         
         # Claude Desktop configurations
         claude_locations = []
-        if self.platform == "windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             if appdata:
                 claude_locations.append(
                     self._check_location("Claude Desktop (AppData)", 
                                        Path(appdata) / "Claude" / "claude_desktop_config.json")
                 )
-        elif self.platform == "darwin":
+        elif IS_DARWIN:
             home = Path.home()
             claude_locations.append(
                 self._check_location("Claude Desktop (macOS)",
                                    home / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json")
             )
-        elif self.platform == "linux":
+        elif IS_LINUX:
             home = Path.home()
             claude_locations.extend([
                 self._check_location("Claude Desktop (XDG)",
@@ -363,7 +416,7 @@ class ConfigurationManager:
         
         # Cline configurations
         cline_locations = []
-        if self.platform == "windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             if appdata:
                 cline_locations.append(
@@ -381,7 +434,7 @@ class ConfigurationManager:
         
         # Cursor configurations  
         cursor_locations = []
-        if self.platform == "windows":
+        if IS_WINDOWS:
             appdata = os.environ.get("APPDATA", "")
             if appdata:
                 cursor_locations.append(
@@ -548,7 +601,7 @@ class ConfigurationManager:
                            custom_args: Optional[List[str]]) -> Dict[str, Any]:
         """Generate configuration for uvx ephemeral execution"""
         uvx_path = shutil.which("uvx")
-        if not uvx_path and self.platform == "windows":
+        if not uvx_path and IS_WINDOWS:
             uvx_path = shutil.which("uvx.exe")
             
         if not uvx_path:
@@ -592,7 +645,7 @@ class ConfigurationManager:
                           custom_args: Optional[List[str]]) -> Dict[str, Any]:
         """Generate configuration for uv project execution"""
         uv_path = shutil.which("uv")
-        if not uv_path and self.platform == "windows":
+        if not uv_path and IS_WINDOWS:
             uv_path = shutil.which("uv.exe")
             
         if not uv_path:
@@ -637,7 +690,7 @@ class ConfigurationManager:
         python_path = shutil.which("python")
         if not python_path:
             python_path = shutil.which("python3")
-        if not python_path and self.platform == "windows":
+        if not python_path and IS_WINDOWS:
             python_path = shutil.which("python.exe")
             
         if not python_path:
@@ -764,18 +817,14 @@ class ConfigurationManager:
                     pass  # Ignore invalid existing config
                     
             # Merge configurations
-            if env_type == EnvironmentType.CLAUDE_DESKTOP and "mcpServers" in existing_config:
-                existing_servers = existing_config.get("mcpServers", {})
-                existing_servers.update(config["mcpServers"])
-                config["mcpServers"] = existing_servers
-            elif "servers" in existing_config:
-                existing_servers = existing_config.get("servers", {})
-                existing_servers.update(config["servers"])
-                config["servers"] = existing_servers
+            if existing_config:
+                if env_type == EnvironmentType.CLAUDE_DESKTOP and "mcpServers" in existing_config:
+                    _merge_servers(existing_config, config, "mcpServers")
+                else:
+                    _merge_servers(existing_config, config, "servers")
                 
             # Write configuration
-            with open(location.path, 'w') as f:
-                json.dump(config, f, indent=2)
+            _write_json_atomic(location.path, config)
                 
             self.console.print(f"✅ Configured {env_type.value} at {location.path}")
             return True
@@ -789,33 +838,34 @@ class ConfigurationManager:
         if not self.detected_environments:
             self.detect_comprehensive_environments()
             
-        # Create summary table
-        table = Table(title="MCP Environment Detection Summary")
-        table.add_column("Environment", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Compatibility", style="yellow")
-        table.add_column("Recommended Method", style="blue")
-        table.add_column("Notes", style="dim")
-        
-        for env in self.detected_environments:
-            status = "✅ Detected" if env.detected else "⚪ Available"
-            compatibility = f"{env.compatibility_score:.1%}"
-            method = env.recommended_method.value.replace("_", " ").title()
-            notes = ", ".join(env.notes[:2])  # Limit notes for table display
-            
-            table.add_row(
-                env.env_type.value.replace("_", " ").title(),
-                status,
-                compatibility,
-                method,
-                notes
-            )
+        # Reuse the rendered table while the detection results are unchanged
+        cached = self._summary_table
+        if cached is not None and cached[0] is self.detected_environments:
+            table = cached[1]
+        else:
+            table = Table(title="MCP Environment Detection Summary")
+            table.add_column("Environment", style="cyan")
+            table.add_column("Status", style="green")
+            table.add_column("Compatibility", style="yellow")
+            table.add_column("Recommended Method", style="blue")
+            table.add_column("Notes", style="dim")
+            
+            for env in self.detected_environments:
+                table.add_row(
+                    _pretty(env.env_type.value),
+                    "✅ Detected" if env.detected else "⚪ Available",
+                    f"{env.compatibility_score:.1%}",
+                    _pretty(env.recommended_method.value),
+                    ", ".join(env.notes[:2])  # Limit notes for table display
+                )
+                
+            self._summary_table = (self.detected_environments, table)
             
         self.console.print(table)
         
         # Display available methods
         methods_panel = Panel(
-            "\n".join([f"• {method.value.replace('_', ' ').title()}" for method in self.available_methods]),
+            "\n".join(f"• {_pretty(method.value)}" for method in self.available_methods),
             title="Available Launch Methods",
             border_style="blue"
         )
@@ -883,23 +933,18 @@ class ConfigurationManager:
                     self.console.print(f"⚠️  Warning: Could not read existing config: {e}")
                     
             # Merge configurations
-            if environment == "claude_desktop" and "mcpServers" in existing_config:
-                # Merge MCP servers
-                existing_servers = existing_config.get("mcpServers", {})
-                existing_servers.update(config_dict["mcpServers"])
-                config_dict["mcpServers"] = existing_servers
-            elif environment == "standard_mcp" and "servers" in existing_config:
-                # Merge standard MCP servers
-                existing_servers = existing_config.get("servers", {})
-                existing_servers.update(config_dict["servers"])
-                config_dict["servers"] = existing_servers
+            if existing_config:
+                _merge_servers(
+                    existing_config,
+                    config_dict,
+                    "mcpServers" if environment == "claude_desktop" else "servers"
+                )
                 
             # Ensure parent directory exists
             target_location.path.parent.mkdir(parents=True, exist_ok=True)
             
             # Write configuration
-            with open(target_location.path, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            _write_json_atomic(target_location.path, config_dict)
                 
             self.console.print(f"✅ Configuration installed successfully")
             return True
@@ -978,18 +1023,22 @@ class ConfigurationManager:
         
         environment_info = {}
         for env_name, env_locations in locations.items():
+            location_info = []
+            writable_count = 0
+            for loc in env_locations:
+                writable = loc.writable
+                location_info.append({
+                    "name": loc.name,
+                    "path": str(loc.path),
+                    "exists": loc.exists,
+                    "writable": writable
+                })
+                writable_count += writable
+                
             environment_info[env_name] = {
                 "supported": True,
-                "locations": [
-                    {
-                        "name": loc.name,
-                        "path": str(loc.path),
-                        "exists": loc.exists,
-                        "writable": loc.writable
-                    }
-                    for loc in env_locations
-                ],
-                "available_locations": len([loc for loc in env_locations if loc.writable])
+                "locations": location_info,
+                "available_locations": writable_count
             }
             
         return environment_info
\ No newline at end of file
@@ -9,25 +9,373 @@ auto-detection, and cross-platform optimization.
 import os
 import sys
 import subprocess
-import shutil
 import platform
 import json
+import random
+import re
 import tempfile
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, Union
+from typing import Optional, List, Dict, Any, Tuple, Union, Sequence, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.tree import Tree
-from packaging import version
+from ._console import LazyConsole
+from ._platform import IS_WINDOWS, NEW_GROUP_KWARGS, invalidate_path_cache, path_scan_outdated, signal_group, stop_process, which
+from .launcher import NodeJSLauncher, NodeJSNotFoundError, NodeInfo
 
-from .launcher import NodeJSLauncher, NodeJSNotFoundError
+if TYPE_CHECKING:
+    # rich is imported lazily at the call sites to keep CLI start-up fast
+    from rich.console import Console
+    from rich.progress import Progress
+
+
+def _executables(name: str, *aliases: str) -> Tuple[str, ...]:
+    """Executable names to look up for a manager, plus the .exe form on Windows"""
+    return (name, *aliases, name + ".exe") if IS_WINDOWS else (name, *aliases)
+
+
+# Detection results keyed by (kind, PATH): which managers are found only
+# depends on what PATH resolves to, so repeat detection in one process is free.
+# Entries are lightweight (manager config, path) pairs in priority order;
+# manager dataclasses are only built for the instance that asks.
+_DETECTION_CACHE: Dict[Tuple[str, str], List[Tuple[Dict[str, Any], str]]] = {}
+
+# Manager definitions, built once at import. Sequences are tuples so the
+# shared definitions can't be mutated through a detected manager instance.
+_PY_MGR_CONFIGS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "uvx",
+        "executables": _executables("uvx"),
+        "supports_nodejs": True,
+        "install_cmd": ("--from", "git+https://github.com/Ghostseller/CastPlan_mcp.git", "castplan-mcp"),
+        "run_cmd": ("castplan-mcp",),
+        "priority": 100,
+        "features": ("ephemeral", "isolated", "fast", "no-install")
+    },
+    {
+        "name": "uv",
+        "executables": _executables("uv"),
+        "supports_nodejs": True,
+        "install_cmd": ("add", "castplan-automation"),
+        "run_cmd": ("run", "castplan-mcp"),
+        "priority": 90,
+        "features": ("fast", "reliable", "modern", "lockfile")
+    },
+    {
+        "name": "pip",
+        "executables": _executables("pip", "pip3"),
+        "supports_nodejs": True,
+        "install_cmd": ("install", "castplan-automation"),
+        "run_cmd": ("castplan-mcp",),
+        "priority": 70,
+        "features": ("universal", "stable", "fallback")
+    }
+)
+
+_NODE_MGR_CONFIGS: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "pnpm",
+        "executables": _executables("pnpm"),
+        "install_cmd": ("add",),
+        "global_flag": "-g",
+        "priority": 95,
+        "performance_score": 1.0,
+        "reliability_score": 0.95,
+        "features": ("fast", "efficient", "workspace", "lockfile")
+    },
+    {
+        "name": "yarn",
+        "executables": _executables("yarn"),
+        "install_cmd": ("global", "add"),
+        "global_flag": "",  # yarn uses 'global add' instead of -g
+        "priority": 85,
+        "performance_score": 0.9,
+        "reliability_score": 0.9,
+        "features": ("workspace", "offline", "deterministic")
+    },
+    {
+        "name": "npm",
+        "executables": _executables("npm"),
+        "install_cmd": ("install",),
+        "global_flag": "-g",
+        "priority": 80,
+        "performance_score": 0.8,
+        "reliability_score": 1.0,
+        "features": ("universal", "stable", "registry")
+    },
+    {
+        "name": "bun",
+        "executables": _executables("bun"),
+        "install_cmd": ("add",),
+        "global_flag": "-g",
+        "priority": 90,
+        "performance_score": 1.0,
+        "reliability_score": 0.85,
+        "features": ("ultra-fast", "all-in-one", "modern")
+    }
+)
+
+# Installation estimates shown in the plan
+_INSTALL_TIME: Dict[str, int] = {  # seconds, by manager name
+    "uvx": 5,    # Very fast ephemeral installation
+    "uv": 15,    # Fast modern installer
+    "pnpm": 20,  # Fast with good caching
+    "yarn": 25,  # Moderately fast
+    "npm": 35,   # Slower but reliable
+}
+_DEFAULT_INSTALL_TIME = 30
+
+_DISK_USAGE: Dict[str, int] = {  # bytes, by installation type
+    "ephemeral": 0,             # No permanent disk usage
+    "local": 50 * 1024 * 1024,  # ~50MB for local installation
+}
+_DEFAULT_DISK_USAGE = 100 * 1024 * 1024  # ~100MB for global installation
+
+# How long a package-installation lookup stays valid (seconds)
+_PACKAGE_PATH_TTL = 5.0
+
+# Environment variables reported by get_comprehensive_info
+_INFO_ENV_VARS = ("PATH", "NODE_PATH", "NPM_CONFIG_PREFIX", "UV_CACHE_DIR", "UV_CONFIG_FILE")
+
+# Manager fields reported by get_comprehensive_info, with getters fetching them in one call
+_PY_INFO_FIELDS = ("name", "path", "version", "priority", "features", "supports_nodejs")
+_NODE_INFO_FIELDS = ("name", "path", "version", "priority", "performance_score", "reliability_score", "features")
+_get_py_info = attrgetter(*_PY_INFO_FIELDS)
+_get_node_info = attrgetter(*_NODE_INFO_FIELDS)
+
+# Node.js managers counted as modern in the reported capabilities
+_MODERN_NODE_MANAGERS = frozenset(("pnpm", "yarn", "bun"))
+
+# Install commands time out after 5 minutes
+_INSTALL_TIMEOUT = 300
+
+# Trailing output lines kept from an install command for its error message
+_OUTPUT_TAIL_LINES = 64
+
+# Upper bound on concurrent `--version` probes, so probing many managers at
+# once never fans out into an unbounded number of threads/processes
+_MAX_PROBE_WORKERS = 8
+
+
+def _max_concurrency() -> int:
+    """Subprocess concurrency cap from CASTPLAN_MAX_CONCURRENCY, default _MAX_PROBE_WORKERS"""
+    try:
+        return max(1, int(os.environ["CASTPLAN_MAX_CONCURRENCY"]))
+    except (KeyError, ValueError):
+        return _MAX_PROBE_WORKERS
+
+
+# Every background subprocess the installer starts (version probes,
+# installs) holds a slot while it runs. Each child holds pipes, so unbounded
+# fan-out can exhaust file descriptors / process handles (e.g. macOS's low
+# default fd limit); keep this cap even when call sites bound their own
+# concurrency. Set CASTPLAN_MAX_CONCURRENCY to override.
+_SUBPROCESS_SLOTS = threading.BoundedSemaphore(_max_concurrency())
+
+# Retry policy for installs that fail on transient errors: exponential
+# backoff from _RETRY_BASE_DELAY, capped at _RETRY_MAX_DELAY, +/- _RETRY_JITTER
+_MAX_RETRIES = 3
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 30.0
+_RETRY_JITTER = 0.5
+
+# Install output that marks a failure as worth retrying (network, registry, locks)...
+_TRANSIENT_ERROR_RE = re.compile(
+    r"timed? ?out|temporary failure|connection (?:reset|refused|aborted)|could not resolve host"
+    r"|too many requests|bad gateway|service unavailable|internal server error"
+    r"|\b(?:429|5\d\d) (?:client|server) error|could not acquire lock|resource temporarily unavailable",
+    re.IGNORECASE
+)
+# ...unless it also shows a failure that no retry can fix
+_PERMANENT_ERROR_RE = re.compile(
+    r"no matching distribution|permission denied|enospc|no space left on device",
+    re.IGNORECASE
+)
+
+
+def _clear_detection_caches() -> None:
+    """Forget the PATH index and detection results, so the next detection rescans"""
+    invalidate_path_cache()
+    _DETECTION_CACHE.clear()
+
+
+# Versions already known in this process, by executable path. Detection hands
+# these to new manager instances so re-detection never re-probes.
+_PROBED_VERSIONS: Dict[str, str] = {}
+
+# Probed versions persist across runs for a day, keyed by executable path + mtime
+_VERSION_CACHE_TTL = 24 * 60 * 60
+
+
+def _version_cache_file() -> Path:
+    """Location of the persisted version cache"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "castplan" / "manager-detection.json"
+
+
+def _version_cache_key(path: str) -> Optional[str]:
+    """Cache key for an executable; changes whenever the executable is replaced"""
+    try:
+        return f"{path}:{os.stat(path).st_mtime_ns}"
+    except OSError:
+        return None
+
+
+def _load_version_cache() -> Dict[str, List[Any]]:
+    """Load unexpired {key: [version, probed_at]} entries, or {} if there is no usable cache"""
+    try:
+        data = json.loads(_version_cache_file().read_bytes())
+    except (OSError, RuntimeError, ValueError):
+        return {}
+        
+    if not isinstance(data, dict):
+        return {}
+        
+    cutoff = time.time() - _VERSION_CACHE_TTL
+    return {
+        key: entry for key, entry in data.items()
+        # Anything malformed (e.g. a hand-edited file) is skipped and simply re-probed
+        if (isinstance(entry, list) and len(entry) == 2
+                and isinstance(entry[0], str) and isinstance(entry[1], (int, float))
+                and entry[1] > cutoff)
+    }
+
+
+def _save_version_cache(cache: Dict[str, List[Any]]) -> None:
+    """Persist the version cache; failures only cost a re-probe next run"""
+    try:
+        cache_file = _version_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file, so concurrent CLI runs never rename each other's partial output
+        tmp = tempfile.NamedTemporaryFile(
+            "w", dir=cache_file.parent, prefix=cache_file.name + ".", suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(json.dumps(cache))
+            os.replace(tmp.name, cache_file)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            raise
+    except (OSError, RuntimeError):
+        pass
+
+
+def _find_manager(manager_config: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the absolute path of the first executable of a manager config found on PATH.
+    
+    The path already carries its real extension on Windows (e.g. npm.cmd), so
+    commands built from it never trigger another PATH or PATHEXT search.
+    """
+    for executable in manager_config["executables"]:
+        path = which(executable)
+        if path:
+            return os.path.abspath(path)  # PATH may contain relative entries
+    return None
+
+
+def _detect_managers(kind: str,
+                     manager_configs: Sequence[Dict[str, Any]],
+                     sort_key: Callable[[Dict[str, Any]], Any]) -> List[Tuple[Dict[str, Any], str]]:
+    """Return (config, path) for each manager found on PATH, highest sort_key first"""
+    if path_scan_outdated():
+        # Something was installed into or removed from a PATH directory since
+        # the last scan, so cached negatives (and positives) may be stale
+        _clear_detection_caches()
+        
+    cache_key = (kind, os.environ.get("PATH", os.defpath))
+    found = _DETECTION_CACHE.get(cache_key)
+    if found is None:
+        found = []
+        for manager_config in manager_configs:
+            path = _find_manager(manager_config)
+            if path:
+                found.append((manager_config, path))
+        found.sort(key=lambda item: sort_key(item[0]), reverse=True)
+        _DETECTION_CACHE[cache_key] = found
+    return found
+
+
+def _is_transient_failure(output: str) -> bool:
+    """Whether a failed install's output suggests that retrying may succeed"""
+    return bool(_TRANSIENT_ERROR_RE.search(output)) and not _PERMANENT_ERROR_RE.search(output)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff before retry number attempt + 1, with jitter"""
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** attempt)
+    return delay * (1 + random.uniform(-_RETRY_JITTER, _RETRY_JITTER))
+
+
+def _read_version(path: str) -> str:
+    """Run `<path> --version` and return its output, or "unknown" if that fails"""
+    try:
+        with _SUBPROCESS_SLOTS:
+            result = subprocess.run(
+                [path, "--version"],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except (subprocess.TimeoutExpired, Exception):
+        pass
+    return "unknown"
+
+
+# How long cancelled installs get to exit after SIGTERM before they are killed (seconds)
+_CANCEL_GRACE = 5.0
+
+class _ProcessGroup:
+    """Tracks install subprocesses racing each other so the losers can be stopped"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._processes: List[subprocess.Popen] = []
+        self._cancelled = False
+        
+    def add(self, process: subprocess.Popen) -> None:
+        """Register a started process, stopping it right away if the race is already over"""
+        with self._lock:
+            self._processes.append(process)
+            cancelled = self._cancelled
+        if cancelled:
+            stop_process(process, _CANCEL_GRACE)
+            
+    @property
+    def cancelled(self) -> bool:
+        """Whether the race is over, so new processes shouldn't be started"""
+        return self._cancelled
+        
+    def cancel(self) -> None:
+        """Stop every registered process, killing those that ignore the request"""
+        with self._lock:
+            self._cancelled = True
+            # A finished winner's group is left alone
+            processes = [p for p in self._processes if p.returncode != 0]
+        # Signal them all first, so they share a single grace period
+        for process in processes:
+            signal_group(process)
+        deadline = time.monotonic() + _CANCEL_GRACE
+        for process in processes:
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                signal_group(process, force=True)
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass  # Unkillable for now; don't hang the winner on it
 
 
 class InstallationError(Exception):
@@ -35,12 +383,22 @@ class InstallationError(Exception):
     pass
 
 
-@dataclass
+class InstallationTimeoutError(InstallationError):
+    """Raised when an install command exceeds the installation timeout"""
+    pass
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+_slotted_dataclass = partial(dataclass, slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+# Managers are compared by identity; value equality would walk every field
+@_slotted_dataclass(eq=False)
 class PackageManager:
     """Information about a detected package manager"""
     name: str
     path: str
-    version: str
+    version: Optional[str]  # None until probed, see NodeJSInstaller._probe_version
     install_cmd: List[str]
     global_flag: str = "-g"
     priority: int = 0
@@ -49,19 +407,19 @@ class PackageManager:
     reliability_score: float = 1.0
     features: List[str] = field(default_factory=list)
     
-@dataclass 
+@_slotted_dataclass(eq=False)
 class PythonManager:
     """Information about detected Python package managers (uv/uvx)"""
     name: str
     path: str
-    version: str
+    version: Optional[str]  # None until probed, see NodeJSInstaller._probe_version
     supports_nodejs: bool
     install_cmd: List[str]
     run_cmd: List[str]
     priority: int
     features: List[str] = field(default_factory=list)
     
-@dataclass
+@_slotted_dataclass
 class InstallationPlan:
     """Comprehensive installation plan with fallback strategies"""
     primary_manager: Union[PackageManager, PythonManager]
@@ -70,6 +428,7 @@ class InstallationPlan:
     estimated_time: int  # seconds
     disk_usage: int  # bytes
     success_probability: float  # 0.0 to 1.0
+    speculative: bool = False  # Race primary and first fallback; installs aren't idempotent, so opt-in
 
 
 class NodeJSInstaller:
@@ -80,17 +439,33 @@ class NodeJSInstaller:
     and cross-platform installation with fallback strategies.
     """
     
+    # Console for user-facing output, created on first use
+    console = LazyConsole()
+    
     def __init__(self, 
                  nodejs_package: str = "@castplan/automation-mcp",
-                 console: Optional[Console] = None):
+                 console: Optional["Console"] = None):
         self.nodejs_package = nodejs_package
-        self.console = console or Console()
+        self.console = console
         self.detected_managers: List[PackageManager] = []
         self.python_managers: List[PythonManager] = []
+        self._by_name: Dict[str, Union[PackageManager, PythonManager]] = {}
         self.installation_history: List[Dict[str, Any]] = []
         self.preferred_managers: List[str] = ["uvx", "uv", "pnpm", "yarn", "npm"]
-        self.platform = platform.system().lower()
+        self.platform = sys.platform  # Same values as SUPPORTED_PLATFORMS
         self.temp_dir = None
+        self._launcher: Optional[NodeJSLauncher] = None
+        self._pkg_path_cache: Optional[Tuple[float, Optional[str]]] = None
+        self._package_json_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        
+    def _spinner(self) -> "Progress":
+        """Create the indeterminate spinner shown while a command runs"""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console
+        )
         
     def detect_python_managers(self) -> List[PythonManager]:
         """
@@ -99,71 +474,27 @@ class NodeJSInstaller:
         Returns:
             List[PythonManager]: List of detected Python managers in priority order
         """
-        python_managers_config = [
-            {
-                "name": "uvx",
-                "executables": ["uvx", "uvx.exe"] if platform.system() == "Windows" else ["uvx"],
-                "supports_nodejs": True,
-                "install_cmd": ["--from", "git+https://github.com/Ghostseller/CastPlan_mcp.git", "castplan-mcp"],
-                "run_cmd": ["castplan-mcp"],
-                "priority": 100,
-                "features": ["ephemeral", "isolated", "fast", "no-install"]
-            },
-            {
-                "name": "uv", 
-                "executables": ["uv", "uv.exe"] if platform.system() == "Windows" else ["uv"],
-                "supports_nodejs": True,
-                "install_cmd": ["add", "castplan-automation"], 
-                "run_cmd": ["run", "castplan-mcp"],
-                "priority": 90,
-                "features": ["fast", "reliable", "modern", "lockfile"]
-            },
-            {
-                "name": "pip",
-                "executables": ["pip", "pip3"] + (["pip.exe"] if platform.system() == "Windows" else []),
-                "supports_nodejs": True,
-                "install_cmd": ["install", "castplan-automation"],
-                "run_cmd": ["castplan-mcp"],
-                "priority": 70,
-                "features": ["universal", "stable", "fallback"]
-            }
+        # Existence check only; versions are probed lazily when displayed,
+        # unless this process already knows them
+        self.python_managers = [
+            PythonManager(
+                name=manager_config["name"],
+                path=path,
+                version=_PROBED_VERSIONS.get(path),
+                supports_nodejs=manager_config["supports_nodejs"],
+                install_cmd=list(manager_config["install_cmd"]),
+                run_cmd=list(manager_config["run_cmd"]),
+                priority=manager_config["priority"],
+                features=list(manager_config["features"])
+            )
+            for manager_config, path in _detect_managers(
+                "python", _PY_MGR_CONFIGS,
+                # Sort by priority (highest first)
+                lambda config: config["priority"]
+            )
         ]
-        
-        detected = []
-        
-        for manager_config in python_managers_config:
-            for executable in manager_config["executables"]:
-                path = shutil.which(executable)
-                if path:
-                    try:
-                        # Get version
-                        result = subprocess.run(
-                            [path, "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
-                        if result.returncode == 0:
-                            version_str = result.stdout.strip()
-                            
-                            manager = PythonManager(
-                                name=manager_config["name"],
-                                path=path,
-                                version=version_str,
-                                supports_nodejs=manager_config["supports_nodejs"],
-                                install_cmd=manager_config["install_cmd"],
-                                run_cmd=manager_config["run_cmd"],
-                                priority=manager_config["priority"],
-                                features=manager_config["features"]
-                            )
-                            detected.append(manager)
-                            break  # Found this manager, move to next
-                            
-                    except (subprocess.TimeoutExpired, Exception):
-                        continue  # Try next executable
-                        
-        # Sort by priority (highest first)
-        return sorted(detected, key=lambda m: m.priority, reverse=True)
+        self._index_managers()
+        return self.python_managers
         
     def detect_package_managers(self) -> List[PackageManager]:
         """
@@ -172,87 +503,120 @@ class NodeJSInstaller:
         Returns:
             List[PackageManager]: List of detected package managers in priority order
         """
-        managers_config = [
-            {
-                "name": "pnpm",
-                "executables": ["pnpm", "pnpm.exe"] if platform.system() == "Windows" else ["pnpm"], 
-                "install_cmd": ["add"],
-                "global_flag": "-g",
-                "priority": 95,
-                "performance_score": 1.0,
-                "reliability_score": 0.95,
-                "features": ["fast", "efficient", "workspace", "lockfile"]
-            },
-            {
-                "name": "yarn", 
-                "executables": ["yarn", "yarn.exe"] if platform.system() == "Windows" else ["yarn"],
-                "install_cmd": ["global", "add"],
-                "global_flag": "",  # yarn uses 'global add' instead of -g
-                "priority": 85,
-                "performance_score": 0.9,
-                "reliability_score": 0.9,
-                "features": ["workspace", "offline", "deterministic"]
-            },
-            {
-                "name": "npm",
-                "executables": ["npm", "npm.exe"] if platform.system() == "Windows" else ["npm"],
-                "install_cmd": ["install"],
-                "global_flag": "-g",
-                "priority": 80,
-                "performance_score": 0.8,
-                "reliability_score": 1.0,
-                "features": ["universal", "stable", "registry"]
-            },
-            {
-                "name": "bun",
-                "executables": ["bun", "bun.exe"] if platform.system() == "Windows" else ["bun"],
-                "install_cmd": ["add"],
-                "global_flag": "-g",
-                "priority": 90,
-                "performance_score": 1.0,
-                "reliability_score": 0.85,
-                "features": ["ultra-fast", "all-in-one", "modern"]
-            }
+        # Existence check only; versions are probed lazily when displayed,
+        # unless this process already knows them
+        self.detected_managers = [
+            PackageManager(
+                name=manager_config["name"],
+                path=path,
+                version=_PROBED_VERSIONS.get(path),
+                install_cmd=list(manager_config["install_cmd"]),
+                global_flag=manager_config["global_flag"],
+                priority=manager_config["priority"],
+                performance_score=manager_config["performance_score"],
+                reliability_score=manager_config["reliability_score"],
+                features=list(manager_config["features"])
+            )
+            for manager_config, path in _detect_managers(
+                "nodejs", _NODE_MGR_CONFIGS,
+                # Sort by priority and performance score
+                lambda config: (config["priority"], config["performance_score"])
+            )
         ]
+        self._index_managers()
+        return self.detected_managers
         
-        detected = []
+    def _index_managers(self) -> None:
+        """Rebuild the name -> manager index after a detection pass"""
+        self._by_name = {m.name: m for m in self.python_managers}
+        self._by_name.update((m.name, m) for m in self.detected_managers)
         
-        for manager_config in managers_config:
-            for executable in manager_config["executables"]:
-                path = shutil.which(executable)
-                if path:
-                    try:
-                        # Get version
-                        result = subprocess.run(
-                            [path, "--version"],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
-                        if result.returncode == 0:
-                            version_str = result.stdout.strip()
-                            
-                            manager = PackageManager(
-                                name=manager_config["name"],
-                                path=path,
-                                version=version_str,
-                                install_cmd=manager_config["install_cmd"],
-                                global_flag=manager_config["global_flag"],
-                                priority=manager_config["priority"],
-                                performance_score=manager_config["performance_score"],
-                                reliability_score=manager_config["reliability_score"],
-                                features=manager_config["features"]
-                            )
-                            detected.append(manager)
-                            break  # Found this manager, move to next
-                            
-                    except (subprocess.TimeoutExpired, Exception):
-                        continue  # Try next executable
-                        
-        # Sort by priority and performance score
-        detected = sorted(detected, key=lambda m: (m.priority, m.performance_score), reverse=True)
-        self.detected_managers = detected
-        return detected
+    def _get_manager(self, name: Optional[str]) -> Optional[Union[PackageManager, PythonManager]]:
+        """Look up a detected manager by name"""
+        return self._by_name.get(name) if name else None
+        
+    def _probe_version(self, manager: Union[PackageManager, PythonManager]) -> str:
+        """Return the manager's version, running `--version` on first use"""
+        if manager.version is None:
+            self._probe_versions([manager])
+        return manager.version
+        
+    def _probe_versions(self, managers: Sequence[Union[PackageManager, PythonManager]],
+                        max_workers: int = _MAX_PROBE_WORKERS) -> None:
+        """
+        Probe the versions of several managers concurrently.
+        
+        Args:
+            managers: Managers to probe; those already probed are skipped
+            max_workers: Cap on concurrent probes
+        """
+        pending = [m for m in managers if m.version is None]
+        if not pending:
+            return
+            
+        # Versions persisted by earlier runs are reused while the executable is unchanged
+        cache = _load_version_cache()
+        keys = [_version_cache_key(m.path) for m in pending]
+        to_probe = []
+        for manager, key in zip(pending, keys):
+            hit = cache.get(key) if key else None
+            if hit:
+                manager.version = _PROBED_VERSIONS[manager.path] = hit[0]
+            else:
+                to_probe.append((manager, key))
+                
+        if not to_probe:
+            return
+            
+        # Probes are subprocess-bound, so threads collapse the wall time
+        # from the sum of all probes into the slowest one
+        paths = [manager.path for manager, _ in to_probe]
+        with ThreadPoolExecutor(max_workers=max(1, min(len(paths), max_workers))) as executor:
+            versions = list(executor.map(_read_version, paths))
+            
+        now = time.time()
+        for (manager, key), version_str in zip(to_probe, versions):
+            manager.version = _PROBED_VERSIONS[manager.path] = version_str
+            if key and version_str != "unknown":
+                cache[key] = [version_str, now]
+                
+        _save_version_cache(cache)
+        
+    def _get_launcher(self) -> NodeJSLauncher:
+        """Return the launcher used for Node.js checks, creating it on first use"""
+        if self._launcher is None:
+            self._launcher = NodeJSLauncher(self.nodejs_package)
+        return self._launcher
+        
+    def _detect_nodejs(self) -> NodeInfo:
+        """Detect Node.js once per installer"""
+        return self._get_launcher().detect_nodejs()
+        
+    def _find_package_installation(self) -> Optional[str]:
+        """Find the installed package, reusing a recent lookup within _PACKAGE_PATH_TTL"""
+        now = time.monotonic()
+        if self._pkg_path_cache is not None and now - self._pkg_path_cache[0] < _PACKAGE_PATH_TTL:
+            return self._pkg_path_cache[1]
+            
+        self._detect_nodejs()
+        package_path = self._get_launcher().find_package_installation()
+        self._pkg_path_cache = (now, package_path)
+        return package_path
+        
+    def _read_package_json(self, package_json_path: Path) -> Optional[Dict[str, Any]]:
+        """Parse a package.json, reusing the last parse while its mtime is unchanged"""
+        try:
+            mtime = package_json_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+            
+        cached = self._package_json_cache.get(package_json_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+            
+        package_data = json.loads(package_json_path.read_bytes())
+        self._package_json_cache[package_json_path] = (mtime, package_data)
+        return package_data
         
     def check_nodejs_installation(self) -> bool:
         """
@@ -262,11 +626,8 @@ class NodeJSInstaller:
             bool: True if everything is properly installed
         """
         try:
-            launcher = NodeJSLauncher(self.nodejs_package)
-            launcher.detect_nodejs()
-            
             # Check if package is installed
-            package_path = launcher.find_package_installation()
+            package_path = self._find_package_installation()
             if package_path:
                 self.console.print(f"✅ Package {self.nodejs_package} is already installed")
                 return True
@@ -304,76 +665,185 @@ class NodeJSInstaller:
             
         # Also detect Python managers for alternative installation paths
         if not self.python_managers:
-            self.python_managers = self.detect_python_managers()
+            self.detect_python_managers()
             
         if not self.detected_managers:
             raise InstallationError("No Node.js package managers found")
             
         # Select manager
-        selected_manager = None
-        if prefer_manager:
-            for manager in self.detected_managers:
-                if manager.name == prefer_manager:
-                    selected_manager = manager
-                    break
-                    
-        if not selected_manager:
+        selected_manager = self._get_manager(prefer_manager)
+        if not isinstance(selected_manager, PackageManager):
             # Use first available (highest priority)
             selected_manager = self.detected_managers[0]
             
         self.console.print(f"🔧 Installing {self.nodejs_package} using {selected_manager.name}")
         
-        # Build install command
-        cmd = [selected_manager.path] + selected_manager.install_cmd
-        
-        if global_install and selected_manager.global_flag:
-            if selected_manager.name == "yarn":
-                # yarn already has 'global add' in install_cmd
-                pass
-            else:
-                cmd.append(selected_manager.global_flag)
-                
-        cmd.append(self.nodejs_package)
+        cmd = self._build_install_command(selected_manager, global_install)
         
         # Execute installation with progress
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console
-            ) as progress:
+            with self._spinner() as progress:
                 task = progress.add_task(f"Installing via {selected_manager.name}...", total=None)
                 
-                result = subprocess.run(
+                from rich.markup import escape
+                self._run_install_command(
                     cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
+                    on_output=lambda line: progress.update(task, description=escape(line[:80]))
                 )
                 
                 progress.update(task, completed=True)
                 
-            if result.returncode == 0:
-                self.console.print(f"✅ Successfully installed {self.nodejs_package}")
-                return True
-            else:
-                error_msg = result.stderr or result.stdout
-                raise InstallationError(f"Installation failed: {error_msg}")
-                
-        except subprocess.TimeoutExpired:
-            raise InstallationError("Installation timed out")
+            self._pkg_path_cache = None  # The package location just changed
+            self.console.print(f"✅ Successfully installed {self.nodejs_package}")
+            return True
+            
+        except InstallationError:
+            raise
         except Exception as e:
             raise InstallationError(f"Installation error: {e}")
             
+    def _build_install_command(self, manager: PackageManager, global_install: bool) -> List[str]:
+        """Build the command line installing the package with a Node.js manager"""
+        cmd = [manager.path] + manager.install_cmd
+        
+        if global_install and manager.global_flag:
+            if manager.name == "yarn":
+                # yarn already has 'global add' in install_cmd
+                pass
+            else:
+                cmd.append(manager.global_flag)
+                
+        cmd.append(self.nodejs_package)
+        return cmd
+        
+    def _run_install_command(self,
+                             cmd: List[str],
+                             group: Optional[_ProcessGroup] = None,
+                             on_output: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Run an install command to completion, streaming its output.
+        
+        Args:
+            cmd: Command line to run
+            group: Process group to register with, so a concurrent winner can stop it
+            on_output: Called with each non-empty output line as it arrives
+            
+        Raises:
+            InstallationTimeoutError: If the command times out
+            InstallationError: If the command fails
+        """
+        with _SUBPROCESS_SLOTS:
+            if group is not None and group.cancelled:
+                raise InstallationError("Installation cancelled")
+                
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                **(NEW_GROUP_KWARGS if group is not None else {})  # Lets the group stop child processes too
+            )
+            if group is not None:
+                group.add(process)
+            
+            timed_out = threading.Event()
+        
+            def stop_on_timeout() -> None:
+                timed_out.set()
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                
+            watchdog = threading.Timer(_INSTALL_TIMEOUT, stop_on_timeout)
+            watchdog.daemon = True
+            watchdog.start()
+        
+            # Only the tail of the output is kept for the error message
+            tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+            try:
+                for line in process.stdout:
+                    line = line.rstrip()
+                    if line:
+                        tail.append(line)
+                        if on_output:
+                            on_output(line)
+                process.wait()
+            finally:
+                watchdog.cancel()
+                process.stdout.close()
+            
+        if timed_out.is_set():
+            raise InstallationTimeoutError("Installation timed out")
+        if process.returncode != 0:
+            error_msg = "\n".join(tail)
+            raise InstallationError(f"Installation failed: {error_msg}")
+            
+    def _race_installs(self,
+                       attempts: List[Tuple[Any, List[str]]]) -> Tuple[Optional[Any], List[Tuple[Any, InstallationError]]]:
+        """
+        Install with several managers at once; the first success wins.
+        
+        Args:
+            attempts: (manager, install command) pairs to run concurrently
+            
+        Returns:
+            Tuple: The winning manager (or None) and the errors of the failed attempts
+        """
+        group = _ProcessGroup()
+        winner = None
+        errors = []
+        
+        with self._spinner() as progress:
+            task = progress.add_task(
+                f"Installing via {' / '.join(m.name for m, _ in attempts)}...", total=None
+            )
+            
+            executor = ThreadPoolExecutor(max_workers=len(attempts))
+            try:
+                futures = {
+                    executor.submit(self._run_install_command, cmd, group): manager
+                    for manager, cmd in attempts
+                }
+                for future in as_completed(futures):
+                    manager = futures[future]
+                    try:
+                        future.result()
+                    except InstallationError as e:
+                        errors.append((manager, e))
+                        continue
+                    except Exception as e:
+                        errors.append((manager, InstallationError(f"Installation error: {e}")))
+                        continue
+                        
+                    winner = manager
+                    group.cancel()  # Stop the slower installs
+                    break
+            finally:
+                if winner is None:
+                    # Failed or interrupted (e.g. Ctrl+C, which the racers' own
+                    # sessions don't receive): stop whatever is still installing
+                    group.cancel()
+                # Don't wait for cancelled installs to wind down
+                executor.shutdown(wait=False)
+                
+            progress.update(task, completed=True)
+            
+        return winner, errors
+        
     def install_with_fallback(self,
                              managers_priority: Optional[List[str]] = None,
-                             global_install: bool = True) -> bool:
+                             global_install: bool = True,
+                             race: bool = False) -> bool:
         """
         Install with automatic fallback to other package managers.
         
         Args:
             managers_priority: List of manager names in priority order
             global_install: Install globally vs locally
+            race: Run the two preferred managers concurrently; installs aren't
+                idempotent, and a stopped loser can leave a partial package behind
             
         Returns:
             bool: True if any installation succeeded
@@ -388,11 +858,10 @@ class NodeJSInstaller:
         # Order managers by priority
         ordered_managers = []
         for manager_name in managers_priority:
-            for manager in self.detected_managers:
-                if manager.name == manager_name:
-                    ordered_managers.append(manager)
-                    break
-                    
+            manager = self._get_manager(manager_name)
+            if isinstance(manager, PackageManager):
+                ordered_managers.append(manager)
+                
         # Add any remaining detected managers
         for manager in self.detected_managers:
             if manager not in ordered_managers:
@@ -401,9 +870,33 @@ class NodeJSInstaller:
         if not ordered_managers:
             raise InstallationError("No package managers available")
             
-        # Try each manager in order
+        if self.check_nodejs_installation():
+            return True
+            
         last_error = None
-        for manager in ordered_managers:
+        remaining = ordered_managers
+        
+        # Race the two preferred managers so a hanging one (e.g. an
+        # unreachable registry) doesn't hold up the next for the full timeout
+        if race and len(ordered_managers) > 1:
+            racers, remaining = ordered_managers[:2], ordered_managers[2:]
+            self.console.print(
+                f"🔄 Trying installation with {racers[0].name} and {racers[1].name} concurrently"
+            )
+            winner, errors = self._race_installs(
+                [(manager, self._build_install_command(manager, global_install)) for manager in racers]
+            )
+            if winner:
+                self._pkg_path_cache = None  # The package location just changed
+                self.console.print(f"✅ Successfully installed {self.nodejs_package} using {winner.name}")
+                return True
+                
+            for manager, error in errors:
+                last_error = error
+                self.console.print(f"❌ {manager.name} installation failed: {error}")
+                
+        # Try the remaining managers in order
+        for manager in remaining:
             try:
                 self.console.print(f"🔄 Trying installation with {manager.name}")
                 success = self.install_nodejs_package(
@@ -439,25 +932,22 @@ class NodeJSInstaller:
         }
         
         try:
-            launcher = NodeJSLauncher(self.nodejs_package)
-            node_info = launcher.detect_nodejs()
+            node_info = self._detect_nodejs()
             
             results["nodejs_installed"] = True
             results["nodejs_version"] = node_info.version
             
             # Check package installation
-            package_path = launcher.find_package_installation()
+            package_path = self._find_package_installation()
             if package_path:
                 results["package_installed"] = True
                 results["package_path"] = package_path
                 
                 # Try to get package version
                 try:
-                    package_json_path = Path(package_path) / "package.json"
-                    if package_json_path.exists():
-                        with open(package_json_path, 'r') as f:
-                            package_data = json.load(f)
-                            results["package_version"] = package_data.get("version")
+                    package_data = self._read_package_json(Path(package_path) / "package.json")
+                    if package_data is not None:
+                        results["package_version"] = package_data.get("version")
                 except Exception as e:
                     results["errors"].append(f"Could not read package version: {e}")
                     
@@ -482,13 +972,15 @@ class NodeJSInstaller:
         
     def create_installation_plan(self, 
                                 prefer_manager: Optional[str] = None,
-                                installation_type: str = "auto") -> InstallationPlan:
+                                installation_type: str = "auto",
+                                speculative: bool = False) -> InstallationPlan:
         """
         Create an intelligent installation plan with fallback strategies.
         
         Args:
             prefer_manager: Preferred package manager name
             installation_type: Installation type (auto, global, local, uvx, ephemeral)
+            speculative: Run the primary and first fallback managers concurrently
             
         Returns:
             InstallationPlan: Comprehensive installation plan
@@ -497,7 +989,7 @@ class NodeJSInstaller:
         if not self.detected_managers:
             self.detect_package_managers()
         if not self.python_managers:
-            self.python_managers = self.detect_python_managers()
+            self.detect_python_managers()
             
         all_managers = []
         
@@ -518,23 +1010,14 @@ class NodeJSInstaller:
         # Handle specific installation types
         if installation_type == "uvx" or installation_type == "ephemeral":
             # Prefer uvx for ephemeral installations
-            for manager in self.python_managers:
-                if manager.name == "uvx":
-                    primary_manager = manager
-                    break
+            primary_manager = self._get_manager("uvx")
         elif installation_type == "uv":
             # Prefer uv for project installations
-            for manager in self.python_managers:
-                if manager.name == "uv":
-                    primary_manager = manager
-                    break
+            primary_manager = self._get_manager("uv")
         elif prefer_manager:
             # Look for preferred manager
-            for manager in all_managers:
-                if manager.name == prefer_manager:
-                    primary_manager = manager
-                    break
-                    
+            primary_manager = self._get_manager(prefer_manager)
+            
         if not primary_manager:
             # Auto-select best available manager
             if installation_type == "auto":
@@ -548,7 +1031,7 @@ class NodeJSInstaller:
             raise InstallationError("No suitable package manager found")
             
         # Create fallback list (excluding primary)
-        fallback_managers = [m for m in all_managers if m != primary_manager]
+        fallback_managers = [m for m in all_managers if m is not primary_manager]
         
         # Determine actual installation type
         if installation_type == "auto":
@@ -561,6 +1044,9 @@ class NodeJSInstaller:
         else:
             actual_type = installation_type
             
+        # Only the selected manager's version is shown in the plan
+        self._probe_version(primary_manager)
+        
         # Estimate installation metrics
         estimated_time = self._estimate_installation_time(primary_manager)
         disk_usage = self._estimate_disk_usage(actual_type)
@@ -572,37 +1058,17 @@ class NodeJSInstaller:
             installation_type=actual_type,
             estimated_time=estimated_time,
             disk_usage=disk_usage,
-            success_probability=success_probability
+            success_probability=success_probability,
+            speculative=speculative
         )
         
     def _estimate_installation_time(self, manager: Union[PackageManager, PythonManager]) -> int:
         """Estimate installation time in seconds"""
-        base_time = 30  # Base installation time
-        
-        if isinstance(manager, PythonManager):
-            if manager.name == "uvx":
-                return 5  # Very fast ephemeral installation
-            elif manager.name == "uv":
-                return 15  # Fast modern installer
-        
-        if isinstance(manager, PackageManager):
-            if manager.name == "pnpm":
-                return 20  # Fast with good caching
-            elif manager.name == "yarn":
-                return 25  # Moderately fast
-            elif manager.name == "npm":
-                return 35  # Slower but reliable
-                
-        return base_time
+        return _INSTALL_TIME.get(manager.name, _DEFAULT_INSTALL_TIME)
         
     def _estimate_disk_usage(self, installation_type: str) -> int:
         """Estimate disk usage in bytes"""
-        if installation_type == "ephemeral":
-            return 0  # No permanent disk usage
-        elif installation_type == "local":
-            return 50 * 1024 * 1024  # ~50MB for local installation
-        else:
-            return 100 * 1024 * 1024  # ~100MB for global installation
+        return _DISK_USAGE.get(installation_type, _DEFAULT_DISK_USAGE)
             
     def _calculate_success_probability(self, 
                                      primary: Union[PackageManager, PythonManager],
@@ -631,12 +1097,8 @@ class NodeJSInstaller:
         Returns:
             bool: True if installation/execution succeeded
         """
-        uvx_manager = None
-        for manager in self.python_managers:
-            if manager.name == "uvx":
-                uvx_manager = manager
-                break
-                
+        uvx_manager = self._get_manager("uvx")
+        
         if not uvx_manager:
             raise InstallationError("uvx not found")
             
@@ -654,11 +1116,7 @@ class NodeJSInstaller:
             cmd.extend(args)
             
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console
-            ) as progress:
+            with self._spinner() as progress:
                 task = progress.add_task("Executing with uvx...", total=None)
                 
                 result = subprocess.run(
@@ -694,12 +1152,8 @@ class NodeJSInstaller:
         Returns:
             bool: True if installation succeeded
         """
-        uv_manager = None
-        for manager in self.python_managers:
-            if manager.name == "uv":
-                uv_manager = manager
-                break
-                
+        uv_manager = self._get_manager("uv")
+        
         if not uv_manager:
             raise InstallationError("uv not found")
             
@@ -714,31 +1168,27 @@ class NodeJSInstaller:
             cmd.extend(["tool", "install", "castplan-automation"])
             
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=self.console
-            ) as progress:
-                task = progress.add_task("Installing with uv...", total=100)
+            with self._spinner() as progress:
+                task = progress.add_task("Installing with uv...", total=None)
                 
-                # Start installation
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                
-                # Monitor progress
-                while process.poll() is None:
-                    progress.advance(task, 1)
-                    time.sleep(0.1)
+                with _SUBPROCESS_SLOTS:
+                    # Start installation
+                    process = subprocess.Popen(
+                        cmd,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True
+                    )
                     
-                progress.update(task, completed=100)
-                
-                stdout, stderr = process.communicate()
+                    # Block until uv exits instead of polling
+                    try:
+                        stdout, stderr = process.communicate(timeout=300)  # 5 minute timeout
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                        process.communicate()
+                        raise
+                    
+                progress.update(task, completed=True)
                 
             if process.returncode == 0:
                 self.console.print("✅ uv installation completed successfully")
@@ -747,13 +1197,16 @@ class NodeJSInstaller:
                 error_msg = stderr or stdout
                 raise InstallationError(f"uv installation failed: {error_msg}")
                 
+        except subprocess.TimeoutExpired:
+            raise InstallationError("uv installation timed out")
         except Exception as e:
             raise InstallationError(f"uv installation error: {e}")
             
     def smart_install(self, 
                      installation_type: str = "auto",
                      prefer_manager: Optional[str] = None,
-                     interactive: bool = True) -> bool:
+                     interactive: bool = True,
+                     speculative: bool = False) -> bool:
         """
         Intelligent installation with automatic tool selection and fallback.
         
@@ -761,13 +1214,14 @@ class NodeJSInstaller:
             installation_type: Installation type preference
             prefer_manager: Preferred package manager
             interactive: Allow interactive prompts
+            speculative: Race the primary manager against the first fallback
             
         Returns:
             bool: True if installation succeeded
         """
         # Create installation plan
         try:
-            plan = self.create_installation_plan(prefer_manager, installation_type)
+            plan = self.create_installation_plan(prefer_manager, installation_type, speculative)
         except InstallationError as e:
             self.console.print(f"❌ Could not create installation plan: {e}")
             return False
@@ -784,13 +1238,9 @@ class NodeJSInstaller:
         panel_content = []
         
         # Primary manager info
-        if isinstance(plan.primary_manager, PythonManager):
-            manager_type = "Python Manager"
-            features = ", ".join(plan.primary_manager.features)
-        else:
-            manager_type = "Node.js Manager"
-            features = ", ".join(plan.primary_manager.features)
-            
+        manager_type = "Python Manager" if isinstance(plan.primary_manager, PythonManager) else "Node.js Manager"
+        features = ", ".join(plan.primary_manager.features)
+        
         panel_content.extend([
             f"[bold cyan]Primary Manager:[/bold cyan] {plan.primary_manager.name} ({manager_type})",
             f"[dim]Version:[/dim] {plan.primary_manager.version}",
@@ -803,6 +1253,7 @@ class NodeJSInstaller:
         if plan.fallback_managers:
             panel_content.append(f"[dim]Fallbacks:[/dim] {len(plan.fallback_managers)} available")
             
+        from rich.panel import Panel
         self.console.print(Panel(
             "\n".join(panel_content),
             title="[bold blue]Installation Plan[/bold blue]",
@@ -812,85 +1263,136 @@ class NodeJSInstaller:
     def _execute_installation_plan(self, plan: InstallationPlan) -> bool:
         """Execute the installation plan with fallback handling"""
         primary = plan.primary_manager
+        fallbacks = plan.fallback_managers
+        global_install = plan.installation_type == "global"
         
-        # Try primary manager
-        try:
-            if isinstance(primary, PythonManager):
-                if primary.name == "uvx":
-                    return self.install_with_uvx()
-                elif primary.name == "uv":
-                    return self.install_with_uv()
-                else:
-                    # Use pip or other Python manager
-                    return self._install_with_python_manager(primary)
-            else:
-                # Use Node.js package manager
-                return self.install_nodejs_package(
-                    prefer_manager=primary.name,
-                    global_install=(plan.installation_type == "global")
-                )
+        attempts = self._speculative_attempts(plan, global_install) if plan.speculative else None
+        if attempts:
+            # Race primary and first fallback; the loser is terminated
+            self.console.print(
+                f"🔄 Trying installation with {primary.name} and {fallbacks[0].name} concurrently"
+            )
+            winner, errors = self._race_installs(attempts)
+            if winner:
+                self._pkg_path_cache = None  # The package location just changed
+                self.console.print(f"✅ Installation with {winner.name} succeeded")
+                return True
                 
-        except InstallationError as e:
-            self.console.print(f"⚠️  Primary installation failed: {e}")
+            for manager, error in errors:
+                self.console.print(f"❌ {manager.name} installation failed: {error}")
+            fallbacks = fallbacks[1:]
+        else:
+            # Try primary manager
+            try:
+                return self._install_with_manager(primary, global_install)
+            except InstallationError as e:
+                self.console.print(f"⚠️  Primary installation failed: {e}")
+                
+        # Try fallback managers
+        for fallback in fallbacks:
+            try:
+                self.console.print(f"🔄 Trying fallback: {fallback.name}")
+                return self._install_with_manager(fallback, global_install)
+            except InstallationError as fallback_error:
+                self.console.print(f"❌ Fallback {fallback.name} failed: {fallback_error}")
+                continue
+                
+        # All methods failed
+        raise InstallationError("All installation methods failed")
+        
+    def _install_with_manager(self,
+                              manager: Union[PackageManager, PythonManager],
+                              global_install: bool) -> bool:
+        """Install with a single manager, dispatching on its kind"""
+        if isinstance(manager, PythonManager):
+            if manager.name == "uvx":
+                return self.install_with_uvx()
+            elif manager.name == "uv":
+                return self.install_with_uv()
+            else:
+                # Use pip or other Python manager
+                return self._install_with_python_manager(manager)
+        else:
+            # Use Node.js package manager
+            return self.install_nodejs_package(
+                prefer_manager=manager.name,
+                global_install=global_install
+            )
             
-            # Try fallback managers
-            for fallback in plan.fallback_managers:
-                try:
-                    self.console.print(f"🔄 Trying fallback: {fallback.name}")
-                    
-                    if isinstance(fallback, PythonManager):
-                        if fallback.name == "uvx":
-                            return self.install_with_uvx()
-                        elif fallback.name == "uv":
-                            return self.install_with_uv()
-                        else:
-                            return self._install_with_python_manager(fallback)
-                    else:
-                        return self.install_nodejs_package(
-                            prefer_manager=fallback.name,
-                            global_install=(plan.installation_type == "global")
-                        )
-                        
-                except InstallationError as fallback_error:
-                    self.console.print(f"❌ Fallback {fallback.name} failed: {fallback_error}")
-                    continue
-                    
-            # All methods failed
-            raise InstallationError("All installation methods failed")
+    def _speculative_attempts(self,
+                              plan: InstallationPlan,
+                              global_install: bool) -> Optional[List[Tuple[Any, List[str]]]]:
+        """
+        Install commands for racing the plan's primary and first fallback managers.
+        
+        Returns:
+            Optional[List]: (manager, command) pairs, or None if the plan can't be raced
+        """
+        if not plan.fallback_managers:
+            return None
             
-        return False
+        attempts = []
+        for manager in (plan.primary_manager, plan.fallback_managers[0]):
+            if isinstance(manager, PythonManager):
+                if manager.name == "uvx":
+                    return None  # uvx runs the server rather than installing it
+                cmd = [manager.path] + manager.install_cmd
+            else:
+                cmd = self._build_install_command(manager, global_install)
+            attempts.append((manager, cmd))
+        return attempts
         
     def _install_with_python_manager(self, manager: PythonManager) -> bool:
-        """Install using a generic Python package manager"""
+        """Install using a generic Python package manager, retrying transient failures"""
         cmd = [manager.path] + manager.install_cmd
         
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            if result.returncode == 0:
-                self.console.print(f"✅ Installation with {manager.name} succeeded")
-                return True
-            else:
-                error_msg = result.stderr or result.stdout
-                raise InstallationError(f"Installation failed: {error_msg}")
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                with self._spinner() as progress:
+                    task = progress.add_task(f"Installing via {manager.name}...", total=None)
+                    # Echo the installer's output live above the spinner
+                    self._run_install_command(
+                        cmd,
+                        on_output=lambda line: progress.console.print(
+                            line, style="dim", markup=False, highlight=False
+                        )
+                    )
+                    progress.update(task, completed=True)
+                    
+            except InstallationTimeoutError:
+                raise InstallationError(f"Installation with {manager.name} timed out")
+            except InstallationError as e:
+                if attempt == _MAX_RETRIES or not _is_transient_failure(str(e)):
+                    raise
+                    
+                delay = _retry_delay(attempt)
+                self.console.print(f"🔄 Retrying in {delay:.1f}s (attempt {attempt + 1}/{_MAX_RETRIES})")
+                time.sleep(delay)
+                continue
+            except Exception as e:
+                raise InstallationError(f"Installation with {manager.name} error: {e}")
                 
-        except subprocess.TimeoutExpired:
-            raise InstallationError(f"Installation with {manager.name} timed out")
-        except Exception as e:
-            raise InstallationError(f"Installation with {manager.name} error: {e}")
+            self.console.print(f"✅ Installation with {manager.name} succeeded")
+            return True
             
     def get_comprehensive_info(self) -> Dict[str, Any]:
         """Get comprehensive installation environment information"""
         if not self.detected_managers:
             self.detect_package_managers()
         if not self.python_managers:
-            self.python_managers = self.detect_python_managers()
+            self.detect_python_managers()
             
+        # Snapshot before probing, so the report is consistent even if
+        # another thread changes the environment meanwhile
+        environ = os.environ
+        environment = {name: environ.get(name, "") for name in _INFO_ENV_VARS}
+        
+        # One probe pass for both kinds, so all probes run concurrently
+        self._probe_versions(self.python_managers + self.detected_managers)
+        
+        python_names = {manager.name for manager in self.python_managers}
+        modern_nodejs_managers = sum(1 for manager in self.detected_managers if manager.name in _MODERN_NODE_MANAGERS)
+        
         return {
             "platform": {
                 "system": platform.system(),
@@ -899,39 +1401,18 @@ class NodeJSInstaller:
                 "python_version": platform.python_version()
             },
             "python_managers": [
-                {
-                    "name": manager.name,
-                    "path": manager.path,
-                    "version": manager.version,
-                    "priority": manager.priority,
-                    "features": manager.features,
-                    "supports_nodejs": manager.supports_nodejs
-                }
+                dict(zip(_PY_INFO_FIELDS, _get_py_info(manager)))
                 for manager in self.python_managers
             ],
             "nodejs_managers": [
-                {
-                    "name": manager.name,
-                    "path": manager.path,
-                    "version": manager.version,
-                    "priority": manager.priority,
-                    "performance_score": manager.performance_score,
-                    "reliability_score": manager.reliability_score,
-                    "features": manager.features
-                }
+                dict(zip(_NODE_INFO_FIELDS, _get_node_info(manager)))
                 for manager in self.detected_managers
             ],
-            "environment": {
-                "PATH": os.environ.get("PATH", ""),
-                "NODE_PATH": os.environ.get("NODE_PATH", ""),
-                "NPM_CONFIG_PREFIX": os.environ.get("NPM_CONFIG_PREFIX", ""),
-                "UV_CACHE_DIR": os.environ.get("UV_CACHE_DIR", ""),
-                "UV_CONFIG_FILE": os.environ.get("UV_CONFIG_FILE", "")
-            },
+            "environment": environment,
             "capabilities": {
-                "uvx_available": any(m.name == "uvx" for m in self.python_managers),
-                "uv_available": any(m.name == "uv" for m in self.python_managers),
-                "modern_nodejs_managers": len([m for m in self.detected_managers if m.name in ["pnpm", "yarn", "bun"]]),
+                "uvx_available": "uvx" in python_names,
+                "uv_available": "uv" in python_names,
+                "modern_nodejs_managers": modern_nodejs_managers,
                 "total_managers": len(self.python_managers) + len(self.detected_managers)
             }
         }
\ No newline at end of file
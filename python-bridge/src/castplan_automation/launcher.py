@@ -11,21 +11,167 @@ import sys
 import subprocess
 import shutil
 import json
-import platform
 import tempfile
 import time
 import signal
-from pathlib import Path
-from typing import Optional, Dict, Any, List, Union, Callable
+import threading
+import weakref
+from typing import Optional, Dict, Any, List, Tuple, Union, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
-import psutil
-from packaging import version
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
+from ._console import LazyConsole
+from ._platform import (
+    IS_WINDOWS, IS_DARWIN, IS_LINUX, PLATFORM, NEW_GROUP_KWARGS,
+    invalidate_path_cache, signal_group, stop_process, which
+)
+
+if TYPE_CHECKING:
+    # rich, psutil and packaging are imported lazily at the call sites to keep CLI start-up fast
+    from rich.console import Console
+
+
+# How long a freshly launched server gets to show signs of life (seconds)
+_STARTUP_GRACE = 1.0
+
+# Process attributes reported by get_server_info
+_SERVER_INFO_ATTRS = ("pid", "status", "cpu_percent", "memory_info", "create_time", "cmdline")
+
+# Node.js executables to look for, in order of preference
+_NODE_NAMES = ("node.exe", "nodejs.exe") if IS_WINDOWS else ("node", "nodejs")
+
+# Other tool executables; on Windows the PATH scan also matches them without their extension
+_NPM_NAME = "npm"
+_UV_NAME = "uv"
+_UVX_NAME = "uvx"
+
+
+def _close_pipes(process: subprocess.Popen) -> None:
+    """Close a process's pipe ends so their file descriptors are released right away"""
+    for stream in (process.stdin, process.stdout, process.stderr):
+        if stream is not None:
+            try:
+                stream.close()
+            except (OSError, ValueError):
+                pass  # e.g. flushing stdin into a dead process
+
+
+def _discard_process(process: subprocess.Popen) -> None:
+    """Stop a process that failed to launch properly and release its resources"""
+    signal_group(process, force=True)
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        pass  # Stuck in the kernel; the pipes are still released below
+    _close_pipes(process)
+
+
+def _forward_stderr(read_fd: int, seen: threading.Event) -> None:
+    """Copy a launched server's stderr to ours line by line, flagging its first output"""
+    try:
+        with open(read_fd, errors="replace") as stream:
+            for line in stream:
+                seen.set()
+                if sys.stderr is not None:  # None under pythonw
+                    sys.stderr.write(line)
+                    sys.stderr.flush()
+    except (OSError, ValueError):
+        pass  # Our own stderr went away; the server keeps running regardless
+    finally:
+        seen.set()  # EOF too: the process is exiting, which the waiter then sees
+
+
+def _popen_forwarding_stderr(cmd: List[str], **kwargs: Any) -> Tuple[subprocess.Popen, threading.Event]:
+    """
+    Start a process whose stderr a thread forwards to ours.
+    
+    Unread logs therefore can't fill a pipe and stall it. A bare pipe is used
+    rather than stderr=PIPE: the forwarding thread owns the read end, so
+    closing the process's pipes never races with its reads.
+    
+    Returns:
+        Tuple: The process, and an event set on its first stderr line (or EOF)
+    """
+    read_fd, write_fd = os.pipe()
+    try:
+        process = subprocess.Popen(cmd, stderr=write_fd, **kwargs)
+    except BaseException:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+        
+    seen = threading.Event()
+    threading.Thread(target=_forward_stderr, args=(read_fd, seen), daemon=True).start()
+    return process, seen
+
+
+def _merge_env(env: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Environment for a child process: None inherits ours as-is, without copying it"""
+    if not env:
+        return None
+    launch_env = os.environ.copy()
+    launch_env.update(env)
+    return launch_env
+
+
+def _global_node_modules_dirs() -> Tuple[str, ...]:
+    """Platform-specific global node_modules directories, in order of preference"""
+    if IS_WINDOWS:
+        dirs = []
+        # Windows npm global locations
+        appdata = os.environ.get("APPDATA", "")
+        if appdata:
+            dirs.append(os.path.join(appdata, "npm", "node_modules"))
+            
+        # Alternative Windows locations
+        program_files = os.environ.get("ProgramFiles", "")
+        if program_files:
+            dirs.append(os.path.join(program_files, "nodejs", "node_modules"))
+        return tuple(dirs)
+        
+    home = os.path.expanduser("~")
+    if IS_DARWIN:
+        # macOS locations
+        return (
+            "/usr/local/lib/node_modules",
+            os.path.join(home, ".npm-global", "lib", "node_modules"),
+            "/opt/homebrew/lib/node_modules",
+        )
+    if IS_LINUX:
+        # Linux locations
+        return (
+            "/usr/lib/node_modules",
+            "/usr/local/lib/node_modules",
+            os.path.join(home, ".npm-global", "lib", "node_modules"),
+            os.path.join(home, ".local", "lib", "node_modules"),
+        )
+    return ()
+
+
+# Computed once: the locations only depend on the platform and the user's environment
+_GLOBAL_NODE_MODULES_DIRS = _global_node_modules_dirs()
+
+
+@lru_cache(maxsize=None)
+def _package_candidates(package: str, global_path: Optional[str]) -> Tuple[Tuple[str, str], ...]:
+    """(package directory, package.json path) pairs to probe, npm's own global root first"""
+    search_dirs = ((global_path,) if global_path else ()) + _GLOBAL_NODE_MODULES_DIRS
+    candidates = []
+    # npm's root is usually one of the standard locations too; probe it only once
+    for search_dir in dict.fromkeys(search_dirs):
+        path = os.path.join(search_dir, package)
+        candidates.append((path, os.path.join(path, "package.json")))
+    return tuple(candidates)
+
+
+def invalidate_cache() -> None:
+    """Forget memoized executable lookups and Node.js detections, e.g. after installing a tool into PATH"""
+    invalidate_path_cache()
+    NodeJSLauncher._detect_cache.clear()
 
 
 class LaunchError(Exception):
@@ -56,6 +202,15 @@ class LaunchMethod(Enum):
     PYTHON_BRIDGE = "python_bridge"
 
 
+# Human-readable launch method names shown in the launch plan
+_METHOD_DESCRIPTIONS: Dict[LaunchMethod, str] = {
+    LaunchMethod.UVX_EPHEMERAL: "uvx (ephemeral, no installation)",
+    LaunchMethod.UV_PROJECT: "uv (modern Python package manager)",
+    LaunchMethod.NODEJS_DIRECT: "Node.js (direct execution)",
+    LaunchMethod.PYTHON_BRIDGE: "pip (traditional Python package manager)"
+}
+
+
 @dataclass
 class LaunchConfiguration:
     """Configuration for launching the MCP server"""
@@ -88,47 +243,68 @@ class NodeJSLauncher:
     intelligent method selection, ephemeral execution, and error recovery.
     """
     
+    # Detection results shared by all launchers, keyed by (node path, minimum version)
+    _detect_cache: Dict[Tuple[str, str], NodeInfo] = {}
+    
+    # Console for user-facing output, created on first use
+    console = LazyConsole()
+    
+    # Launch entry point per method, shared by the primary attempt and the fallbacks
+    _LAUNCHERS: Dict[LaunchMethod, Callable[["NodeJSLauncher", LaunchConfiguration], subprocess.Popen]] = {
+        LaunchMethod.UVX_EPHEMERAL: lambda self, config: self.launch_with_uvx(config.args, config.env),
+        LaunchMethod.UV_PROJECT: lambda self, config: self.launch_with_uv(config.args, config.env),
+        LaunchMethod.NODEJS_DIRECT: lambda self, config: self.launch_server(config.args, config.env, config.cwd),
+        # Use traditional pip-based approach
+        LaunchMethod.PYTHON_BRIDGE: lambda self, config: self._launch_with_pip(config.args, config.env),
+    }
+    
     def __init__(self, 
                  nodejs_package: str = "@castplan/ultimate-automation-mcp",
                  python_package: str = "castplan-ultimate-automation",
                  min_version: str = "18.0.0",
-                 console: Optional[Console] = None):
+                 console: Optional["Console"] = None):
         self.nodejs_package = nodejs_package
         self.python_package = python_package
         self.min_version = min_version
-        self.console = console or Console()
+        self._min_version = None  # Parsed min_version, filled in on first version check
+        self.console = console
         self.process: Optional[subprocess.Popen] = None
+        self._launched = weakref.WeakSet()  # Every process started, so exited ones can be reaped
+        self._stderr_seen: "weakref.WeakKeyDictionary[subprocess.Popen, threading.Event]" = weakref.WeakKeyDictionary()
         self.node_info: Optional[NodeInfo] = None
         self.launch_config: Optional[LaunchConfiguration] = None
         self.available_methods: List[LaunchMethod] = []
-        self.platform = platform.system().lower()
+        self.platform = PLATFORM
         self.temp_dirs: List[str] = []
         
     def detect_nodejs(self) -> NodeInfo:
         """
         Detect Node.js installation and validate version.
         
+        The result is reused for the lifetime of the launcher, and by other
+        launchers resolving the same node executable.
+        
         Returns:
             NodeInfo: Information about detected Node.js installation
             
         Raises:
             NodeJSNotFoundError: If Node.js not found or incompatible
         """
+        if self.node_info is not None:
+            return self.node_info
+            
         # Try common Node.js executables
-        node_names = ["node", "nodejs"]
-        if platform.system() == "Windows":
-            node_names = ["node.exe", "nodejs.exe"]
-            
-        node_path = None
-        for name in node_names:
-            path = shutil.which(name)
-            if path:
-                node_path = path
-                break
+        node_path = next(filter(None, map(which, _NODE_NAMES)), None)
                 
         if not node_path:
             raise NodeJSNotFoundError("Node.js not found in PATH")
             
+        cache_key = (node_path, self.min_version)
+        cached = self._detect_cache.get(cache_key)
+        if cached is not None:
+            self.node_info = cached
+            return cached
+            
         # Check version
         try:
             result = subprocess.run(
@@ -141,7 +317,10 @@ class NodeJSLauncher:
                 raise NodeJSNotFoundError(f"Failed to get Node.js version: {result.stderr}")
                 
             version_str = result.stdout.strip().lstrip('v')
-            if version.parse(version_str) < version.parse(self.min_version):
+            from packaging import version
+            if self._min_version is None:
+                self._min_version = version.parse(self.min_version)
+            if version.parse(version_str) < self._min_version:
                 raise NodeJSNotFoundError(
                     f"Node.js version {version_str} is below minimum {self.min_version}"
                 )
@@ -152,9 +331,7 @@ class NodeJSLauncher:
             raise NodeJSNotFoundError(f"Error checking Node.js version: {e}")
             
         # Detect npm
-        npm_path = shutil.which("npm")
-        if platform.system() == "Windows" and not npm_path:
-            npm_path = shutil.which("npm.exe")
+        npm_path = which(_NPM_NAME)
             
         # Get global installation path
         global_path = None
@@ -162,7 +339,8 @@ class NodeJSLauncher:
             try:
                 result = subprocess.run(
                     [npm_path, "root", "-g"],
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
                     text=True,
                     timeout=10
                 )
@@ -177,6 +355,7 @@ class NodeJSLauncher:
             npm_path=npm_path,
             global_path=global_path
         )
+        self._detect_cache[cache_key] = self.node_info
         
         return self.node_info
         
@@ -190,47 +369,13 @@ class NodeJSLauncher:
         if not self.node_info:
             self.detect_nodejs()
             
-        # Search locations in order of preference
-        search_paths = []
-        
-        # Global installation
-        if self.node_info.global_path:
-            search_paths.append(Path(self.node_info.global_path) / self.nodejs_package)
-            
-        # Platform-specific global locations
-        system = platform.system()
-        if system == "Windows":
-            # Windows npm global locations
-            appdata = os.environ.get("APPDATA", "")
-            if appdata:
-                search_paths.append(Path(appdata) / "npm" / "node_modules" / self.nodejs_package)
-            
-            # Alternative Windows locations
-            program_files = os.environ.get("ProgramFiles", "")
-            if program_files:
-                search_paths.append(Path(program_files) / "nodejs" / "node_modules" / self.nodejs_package)
-                
-        elif system == "Darwin":
-            # macOS locations
-            search_paths.extend([
-                Path("/usr/local/lib/node_modules") / self.nodejs_package,
-                Path.home() / ".npm-global" / "lib" / "node_modules" / self.nodejs_package,
-                Path("/opt/homebrew/lib/node_modules") / self.nodejs_package
-            ])
-            
-        elif system == "Linux":
-            # Linux locations
-            search_paths.extend([
-                Path("/usr/lib/node_modules") / self.nodejs_package,
-                Path("/usr/local/lib/node_modules") / self.nodejs_package,
-                Path.home() / ".npm-global" / "lib" / "node_modules" / self.nodejs_package,
-                Path.home() / ".local" / "lib" / "node_modules" / self.nodejs_package
-            ])
-            
-        # Check each path
-        for path in search_paths:
-            if path.exists() and (path / "package.json").exists():
-                return str(path)
+        # Check each location; one stat of package.json also proves the directory exists
+        for path, manifest in _package_candidates(self.nodejs_package, self.node_info.global_path):
+            try:
+                os.stat(manifest)
+            except OSError:
+                continue
+            return path
                 
         return None
         
@@ -243,21 +388,24 @@ class NodeJSLauncher:
         """
         methods = []
         
-        # Check for uvx (highest priority for ephemeral execution)
-        if self._check_uvx_available():
-            methods.append(LaunchMethod.UVX_EPHEMERAL)
-            
-        # Check for uv (modern Python package manager)
-        if self._check_uv_available():
-            methods.append(LaunchMethod.UV_PROJECT)
+        # Build the PATH index first, so the worker and this thread don't both scan it cold
+        which(_UVX_NAME)
+        
+        # Node.js detection spawns node and npm, so let it run while PATH is checked
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            nodejs_ready = executor.submit(self._check_nodejs_available)
             
-        # Check for Node.js direct execution
-        try:
-            self.detect_nodejs()
-            if self.find_package_installation():
+            # Check for uvx (highest priority for ephemeral execution)
+            if self._check_uvx_available():
+                methods.append(LaunchMethod.UVX_EPHEMERAL)
+                
+            # Check for uv (modern Python package manager)
+            if self._check_uv_available():
+                methods.append(LaunchMethod.UV_PROJECT)
+                
+            # Check for Node.js direct execution
+            if nodejs_ready.result():
                 methods.append(LaunchMethod.NODEJS_DIRECT)
-        except NodeJSNotFoundError:
-            pass
             
         # Python bridge method (pip-based) is always available
         methods.append(LaunchMethod.PYTHON_BRIDGE)
@@ -267,17 +415,19 @@ class NodeJSLauncher:
         
     def _check_uvx_available(self) -> bool:
         """Check if uvx is available"""
-        uvx_path = shutil.which("uvx")
-        if not uvx_path and self.platform == "windows":
-            uvx_path = shutil.which("uvx.exe")
-        return uvx_path is not None
+        return which(_UVX_NAME) is not None
         
     def _check_uv_available(self) -> bool:
         """Check if uv is available"""
-        uv_path = shutil.which("uv")
-        if not uv_path and self.platform == "windows":
-            uv_path = shutil.which("uv.exe")
-        return uv_path is not None
+        return which(_UV_NAME) is not None
+        
+    def _check_nodejs_available(self) -> bool:
+        """Check if Node.js and the installed package can run the server directly"""
+        try:
+            self.detect_nodejs()
+            return self.find_package_installation() is not None
+        except NodeJSNotFoundError:
+            return False
         
     def create_launch_configuration(self,
                                   preferred_method: Optional[LaunchMethod] = None,
@@ -339,10 +489,7 @@ class NodeJSLauncher:
         Returns:
             subprocess.Popen: The launched process
         """
-        uvx_path = shutil.which("uvx")
-        if not uvx_path and self.platform == "windows":
-            uvx_path = shutil.which("uvx.exe")
-            
+        uvx_path = which(_UVX_NAME)
         if not uvx_path:
             raise UvxNotFoundError("uvx not found in PATH")
             
@@ -354,39 +501,107 @@ class NodeJSLauncher:
         if args:
             cmd.extend(args)
             
-        # Setup environment
-        launch_env = os.environ.copy()
-        if env:
-            launch_env.update(env)
-            
+        process = None
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console
-            ) as progress:
-                task = progress.add_task("Starting uvx execution...", total=None)
-                
-                process = subprocess.Popen(
-                    cmd,
-                    env=launch_env,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
+            # A spinner only helps a person watching; headless callers skip its render thread
+            progress = None
+            if self.console.is_terminal and not os.environ.get("CASTPLAN_NO_PROGRESS"):
+                from rich.progress import Progress, SpinnerColumn, TextColumn
+                progress = Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=self.console
                 )
                 
-                # Give it a moment to start
-                time.sleep(1)
-                progress.update(task, completed=True)
+            with progress or nullcontext():
+                if progress is not None:
+                    task = progress.add_task("Starting uvx execution...", total=None)
+                
+                process = self._spawn(cmd, env)
+                
+                # Return as soon as it shows signs of life instead of a fixed delay
+                self._wait_for_startup(process)
+                if progress is not None:
+                    progress.update(task, completed=True)
                 
             self.process = process
             self.console.print("✅ uvx execution started successfully")
             return process
             
         except Exception as e:
+            if process is not None:
+                _discard_process(process)
             raise EphemeralExecutionError(f"Failed to launch with uvx: {e}")
+        except BaseException:
+            # e.g. Ctrl+C during the start-up wait: the server's own session
+            # doesn't get the signal, and nothing else tracks it yet
+            if process is not None:
+                _discard_process(process)
+            raise
+            
+    def _spawn(self,
+               cmd: List[str],
+               env: Optional[Dict[str, str]] = None,
+               cwd: Optional[str] = None) -> subprocess.Popen:
+        """
+        Start a server process the way every launch method does.
+        
+        The process talks MCP over its stdin/stdout pipes and leads its own
+        process group, so stopping it also stops anything it spawned. Its
+        stderr is forwarded to ours, and the first log line tells
+        _wait_for_startup that it is up.
+        
+        Args:
+            cmd: Command line to run
+            env: Environment variables to add to ours
+            cwd: Working directory
             
+        Returns:
+            subprocess.Popen: The started process
+        """
+        process, seen = _popen_forwarding_stderr(
+            cmd,
+            env=_merge_env(env),
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            **NEW_GROUP_KWARGS
+        )
+        self._stderr_seen[process] = seen
+        self._launched.add(process)
+        return process
+        
+    def _wait_for_startup(self, process: subprocess.Popen, timeout: float = _STARTUP_GRACE) -> None:
+        """
+        Wait until a launched process logs to stderr, or timeout seconds pass.
+        
+        MCP servers keep stdout quiet until a request arrives, so their first
+        stderr line is the sign of life.
+        
+        Raises:
+            EphemeralExecutionError: If the process exits during the wait
+        """
+        deadline = time.monotonic() + timeout
+        seen = self._stderr_seen.get(process)
+        
+        while process.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+                
+            if seen is None:
+                time.sleep(min(remaining, 0.02))
+            elif seen.wait(min(remaining, 0.05)):
+                # Output (or EOF) arrived; a crash usually prints and exits right
+                # away, so only report success once the process outlives a short check
+                try:
+                    process.wait(timeout=0.05)
+                except subprocess.TimeoutExpired:
+                    return
+                    
+        raise EphemeralExecutionError(f"Process exited during startup with code {process.returncode}")
+        
     def launch_with_uv(self,
                       args: Optional[List[str]] = None,
                       env: Optional[Dict[str, str]] = None,
@@ -402,10 +617,7 @@ class NodeJSLauncher:
         Returns:
             subprocess.Popen: The launched process
         """
-        uv_path = shutil.which("uv")
-        if not uv_path and self.platform == "windows":
-            uv_path = shutil.which("uv.exe")
-            
+        uv_path = which(_UV_NAME)
         if not uv_path:
             raise LaunchError("uv not found in PATH")
             
@@ -420,20 +632,8 @@ class NodeJSLauncher:
         if args:
             cmd.extend(args)
             
-        # Setup environment
-        launch_env = os.environ.copy()
-        if env:
-            launch_env.update(env)
-            
         try:
-            process = subprocess.Popen(
-                cmd,
-                env=launch_env,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            process = self._spawn(cmd, env)
             
             self.process = process
             self.console.print("✅ uv execution started successfully")
@@ -477,15 +677,8 @@ class NodeJSLauncher:
         
     def _display_launch_plan(self, config: LaunchConfiguration) -> None:
         """Display the launch plan to user"""
-        method_descriptions = {
-            LaunchMethod.UVX_EPHEMERAL: "uvx (ephemeral, no installation)",
-            LaunchMethod.UV_PROJECT: "uv (modern Python package manager)",
-            LaunchMethod.NODEJS_DIRECT: "Node.js (direct execution)",
-            LaunchMethod.PYTHON_BRIDGE: "pip (traditional Python package manager)"
-        }
-        
         panel_content = [
-            f"[bold cyan]Launch Method:[/bold cyan] {method_descriptions.get(config.method, config.method.value)}",
+            f"[bold cyan]Launch Method:[/bold cyan] {_METHOD_DESCRIPTIONS.get(config.method, config.method.value)}",
             f"[dim]Ephemeral:[/dim] {'Yes' if config.ephemeral else 'No'}",
             f"[dim]Package:[/dim] {config.python_package if config.method != LaunchMethod.NODEJS_DIRECT else config.nodejs_package}",
         ]
@@ -493,6 +686,7 @@ class NodeJSLauncher:
         if config.args:
             panel_content.append(f"[dim]Arguments:[/dim] {' '.join(config.args)}")
             
+        from rich.panel import Panel
         self.console.print(Panel(
             "\n".join(panel_content),
             title="[bold blue]Launch Plan[/bold blue]",
@@ -503,38 +697,25 @@ class NodeJSLauncher:
         """Execute the launch plan with fallback handling"""
         try:
             # Try primary method
-            if config.method == LaunchMethod.UVX_EPHEMERAL:
-                return self.launch_with_uvx(config.args, config.env)
-            elif config.method == LaunchMethod.UV_PROJECT:
-                return self.launch_with_uv(config.args, config.env)
-            elif config.method == LaunchMethod.NODEJS_DIRECT:
-                return self.launch_server(config.args, config.env, config.cwd)
-            elif config.method == LaunchMethod.PYTHON_BRIDGE:
-                # Use traditional pip-based approach
-                return self._launch_with_pip(config.args, config.env)
-            else:
+            launcher = self._LAUNCHERS.get(config.method)
+            if launcher is None:
                 raise LaunchError(f"Unsupported launch method: {config.method}")
-                
+            return launcher(self, config)
+            
         except (LaunchError, UvxNotFoundError, EphemeralExecutionError) as e:
             self.console.print(f"⚠️  Primary launch method failed: {e}")
             
             if not config.fallback_enabled:
                 raise
                 
-            # Try fallback methods
-            for fallback_method in self.available_methods:
+            # Try fallback methods, detecting them first if nothing has yet
+            for fallback_method in self.available_methods or self.detect_available_launch_methods():
                 if fallback_method == config.method:
                     continue  # Skip the method that just failed
                     
                 try:
                     self.console.print(f"🔄 Trying fallback: {fallback_method.value}")
-                    
-                    if fallback_method == LaunchMethod.NODEJS_DIRECT:
-                        return self.launch_server(config.args, config.env, config.cwd)
-                    elif fallback_method == LaunchMethod.PYTHON_BRIDGE:
-                        return self._launch_with_pip(config.args, config.env)
-                    # Add other fallback methods as needed
-                        
+                    return self._LAUNCHERS[fallback_method](self, config)
                 except Exception as fallback_error:
                     self.console.print(f"❌ Fallback {fallback_method.value} failed: {fallback_error}")
                     continue
@@ -550,19 +731,8 @@ class NodeJSLauncher:
         if args:
             cmd.extend(args)
             
-        launch_env = os.environ.copy()
-        if env:
-            launch_env.update(env)
-            
         try:
-            process = subprocess.Popen(
-                cmd,
-                env=launch_env,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            process = self._spawn(cmd, env)
             
             self.process = process
             return process
@@ -595,23 +765,15 @@ class NodeJSLauncher:
     def _cleanup_ephemeral_process(self, process: subprocess.Popen) -> None:
         """Clean up ephemeral process and temporary resources"""
         try:
-            if process.poll() is None:  # Process is still running
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    process.wait(timeout=5)
+            # Even once uvx itself has exited, its children may still be running
+            stop_process(process, timeout=5)
+            _close_pipes(process)
         except Exception as e:
             self.console.print(f"⚠️  Warning: Could not clean up ephemeral process: {e}")
             
         # Clean up any temporary directories
         for temp_dir in self.temp_dirs:
-            try:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-            except Exception:
-                pass  # Ignore cleanup errors
+            shutil.rmtree(temp_dir, ignore_errors=True)  # Missing or busy dirs are fine
                 
         self.temp_dirs.clear()
         
@@ -665,30 +827,17 @@ class NodeJSLauncher:
             raise LaunchError(f"Package {self.nodejs_package} not found")
             
         # Build command
-        main_script = Path(package_path) / "dist" / "index.js"
-        if not main_script.exists():
+        main_script = os.path.join(package_path, "dist", "index.js")
+        if not os.path.isfile(main_script):
             raise LaunchError(f"Main script not found: {main_script}")
             
-        cmd = [self.node_info.path, str(main_script)]
+        cmd = [self.node_info.path, main_script]
         if args:
             cmd.extend(args)
             
-        # Setup environment
-        launch_env = os.environ.copy()
-        if env:
-            launch_env.update(env)
-            
         # Launch process
         try:
-            self.process = subprocess.Popen(
-                cmd,
-                env=launch_env,
-                cwd=cwd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            self.process = self._spawn(cmd, env, cwd)
             
             return self.process
             
@@ -719,20 +868,14 @@ class NodeJSLauncher:
             return True
             
         try:
-            # Try graceful shutdown
-            self.process.terminate()
-            try:
-                self.process.wait(timeout=timeout)
-                return True
-            except subprocess.TimeoutExpired:
-                # Force kill if graceful shutdown fails
-                self.process.kill()
-                self.process.wait(timeout=5)
-                return True
-                
+            # Try graceful shutdown, force killing the group if it doesn't exit in time
+            stop_process(self.process, timeout)
+            return True
+            
         except Exception:
             return False
         finally:
+            _close_pipes(self.process)
             self.process = None
             
     def get_server_info(self) -> Optional[Dict[str, Any]]:
@@ -745,16 +888,13 @@ class NodeJSLauncher:
         if not self.is_running():
             return None
             
+        import psutil
         try:
-            proc = psutil.Process(self.process.pid)
-            return {
-                "pid": proc.pid,
-                "status": proc.status(),
-                "cpu_percent": proc.cpu_percent(),
-                "memory_info": proc.memory_info()._asdict(),
-                "create_time": proc.create_time(),
-                "cmdline": proc.cmdline()
-            }
+            # as_dict reads everything in one oneshot() pass over /proc
+            info = psutil.Process(self.process.pid).as_dict(attrs=_SERVER_INFO_ATTRS)
+            if info["memory_info"] is not None:  # None if access to it was denied
+                info["memory_info"] = info["memory_info"]._asdict()
+            return info
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return None
             
@@ -766,12 +906,13 @@ class NodeJSLauncher:
         """Context manager exit - cleanup process and resources"""
         self.stop_server()
         
+        # Reap any other process started here that has exited, releasing its pipes
+        for process in list(self._launched):
+            if process.poll() is not None:
+                _close_pipes(process)
+        
         # Clean up temporary directories
         for temp_dir in self.temp_dirs:
-            try:
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
-            except Exception:
-                pass  # Ignore cleanup errors
+            shutil.rmtree(temp_dir, ignore_errors=True)  # Missing or busy dirs are fine
                 
         self.temp_dirs.clear()
\ No newline at end of file